@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 import polars._reexport as pl
 from polars import functions as F
+from polars.utils._parse_expr_input import (
+    parse_as_list_of_aggregations,
+    parse_as_list_of_expressions,
+)
+from polars.utils._wrap import wrap_df, wrap_s
 from polars.utils.convert import _timedelta_to_pl_duration
 from polars.utils.deprecation import deprecate_renamed_function
 
@@ -11,7 +17,7 @@ if TYPE_CHECKING:
     import sys
     from datetime import timedelta
 
-    from polars import DataFrame
+    from polars import DataFrame, Expr, Series
     from polars.type_aliases import (
         ClosedInterval,
         IntoExpr,
@@ -27,6 +33,157 @@ if TYPE_CHECKING:
         from typing_extensions import Self
 
 
+_GROUP_INDICES = "__POLARS_GB_GROUP_INDICES"
+
+
+@lru_cache(None)
+def _shorthand_aggs() -> dict[str, Expr]:
+    """Build the expressions of the shorthand aggregations once and reuse them."""
+    return {
+        "all": F.all(),
+        "first": F.all().first(),
+        "last": F.all().last(),
+        "max": F.all().max(),
+        "mean": F.all().mean(),
+        "median": F.all().median(),
+        "min": F.all().min(),
+        "n_unique": F.all().n_unique(),
+        "sum": F.all().sum(),
+    }
+
+
+def _contiguous_group_slices(
+    group_indices: Series, lengths: Series, *, check: bool
+) -> tuple[list[int], list[int]] | None:
+    """
+    Return the offset and length of every group if all groups are contiguous.
+
+    Group indices are ascending within each group, so a group is a contiguous
+    slice of the frame exactly when its first and last index span its length.
+    Returns ``None`` if any group is not contiguous. With ``check=False`` the
+    groups are known to be contiguous and are not checked.
+    """
+    offsets = group_indices.list.first()
+    if check:
+        spans = (group_indices.list.last() - offsets + 1).fill_null(0)
+        if not (spans == lengths).all():
+            return None
+    return offsets.fill_null(0).to_list(), lengths.to_list()
+
+
+class _GroupSliceIterator:
+    """Iterator over groups that are contiguous slices of a DataFrame."""
+
+    __slots__ = ("_df", "_names", "_offsets", "_lengths", "_i", "_n")
+
+    def __init__(
+        self,
+        df: DataFrame,
+        names: Iterator[object],
+        offsets: list[int],
+        lengths: list[int],
+    ):
+        self._df = df
+        self._names = names
+        self._offsets = offsets
+        self._lengths = lengths
+        self._i = 0
+        self._n = len(offsets)
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> tuple[object, DataFrame]:
+        i = self._i
+        if i >= self._n:
+            raise StopIteration
+        self._i = i + 1
+        return next(self._names), self._df.slice(self._offsets[i], self._lengths[i])
+
+
+class _GroupTakeIterator:
+    """
+    Iterator over groups that are gathered from a DataFrame by row index.
+
+    The list column of group indices is flattened once into a single index column
+    plus the offset and length of every group, so that each step only slices that
+    column instead of extracting a list element.
+    """
+
+    __slots__ = ("_df", "_names", "_indices", "_offsets", "_lengths", "_i", "_n")
+
+    def __init__(
+        self,
+        df: DataFrame,
+        names: Iterator[object],
+        indices: Series,
+        lengths: Series,
+    ):
+        self._df = df
+        self._names = names
+        # Empty groups explode to a null; row indices themselves are never null
+        self._indices = indices.explode().drop_nulls()
+        self._offsets = (lengths.cumsum() - lengths).to_list()
+        self._lengths = lengths.to_list()
+        self._i = 0
+        self._n = len(self._lengths)
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> tuple[object, DataFrame]:
+        i = self._i
+        if i >= self._n:
+            raise StopIteration
+        self._i = i + 1
+        indices = self._indices.slice(self._offsets[i], self._lengths[i])
+        return next(self._names), self._df._take_with_series(indices)
+
+
+def _iter_groups(
+    df: DataFrame,
+    group_names: DataFrame,
+    group_indices: Series,
+    *,
+    single_key: bool,
+    contiguous: bool | None,
+) -> Iterator[tuple[object, DataFrame]]:
+    """
+    Iterate over the groups of `df` as (name, data) tuples.
+
+    Parameters
+    ----------
+    df
+        DataFrame that was grouped.
+    group_names
+        The group keys, one row per group.
+    group_indices
+        List column with the row indices of each group.
+    single_key
+        Whether the group name is a single value rather than a tuple of values.
+    contiguous
+        Whether all groups are contiguous, so that they can be sliced instead of
+        gathered. If ``None``, this is checked from the group indices.
+
+    """
+    # When grouping by a single column, group name is a single value
+    # When grouping by multiple columns, group name is a tuple of values
+    names: Iterator[object]
+    if single_key:
+        names = iter(group_names.to_series())
+    else:
+        names = zip(*(s.to_list() for s in group_names.get_columns()))
+
+    lengths = group_indices.list.lengths()
+    if contiguous is not False:
+        slices = _contiguous_group_slices(
+            group_indices, lengths, check=contiguous is None
+        )
+        if slices is not None:
+            return _GroupSliceIterator(df, names, *slices)
+    return _GroupTakeIterator(df, names, group_indices, lengths)
+
+
 class GroupBy:
     """Starts a new GroupBy operation."""
 
@@ -60,8 +217,9 @@ class GroupBy:
         self.by = by
         self.more_by = more_by
         self.maintain_order = maintain_order
+        self._by_exprs = parse_as_list_of_expressions(by, *more_by)
 
-    def __iter__(self) -> Self:
+    def __iter__(self) -> Iterator[tuple[object, DataFrame]]:
         """
         Allows iteration over the groups of the group by operation.
 
@@ -95,41 +253,16 @@ class GroupBy:
         └─────┴─────┘
 
         """
-        temp_col = "__POLARS_GB_GROUP_INDICES"
-        groups_df = (
-            self.df.lazy()
-            .with_row_count(name=temp_col)
-            .group_by(self.by, *self.more_by, maintain_order=self.maintain_order)
-            .agg(F.col(temp_col))
-            .collect(no_optimization=True)
+        group_names, group_indices = self.df._df.group_by_indices(
+            self._by_exprs, self.maintain_order
+        )
+        return _iter_groups(
+            self.df,
+            wrap_df(group_names),
+            wrap_s(group_indices),
+            single_key=isinstance(self.by, (str, pl.Expr)) and not self.more_by,
+            contiguous=None if self.maintain_order else False,
         )
-
-        group_names = groups_df.select(F.all().exclude(temp_col))
-
-        # When grouping by a single column, group name is a single value
-        # When grouping by multiple columns, group name is a tuple of values
-        self._group_names: Iterator[object] | Iterator[tuple[object, ...]]
-        if isinstance(self.by, (str, pl.Expr)) and not self.more_by:
-            self._group_names = iter(group_names.to_series())
-        else:
-            self._group_names = group_names.iter_rows()
-
-        self._group_indices = groups_df.select(temp_col).to_series()
-        self._current_index = 0
-
-        return self
-
-    def __next__(
-        self,
-    ) -> tuple[object, DataFrame] | tuple[tuple[object, ...], DataFrame]:
-        if self._current_index >= len(self._group_indices):
-            raise StopIteration
-
-        group_name = next(self._group_names)
-        group_data = self.df[self._group_indices[self._current_index]]
-        self._current_index += 1
-
-        return group_name, group_data
 
     def agg(
         self,
@@ -236,12 +369,29 @@ class GroupBy:
         │ b   ┆ 5     ┆ 10.0           │
         └─────┴───────┴────────────────┘
 
+        The groups are computed once and shared by all aggregations, so prefer a
+        single call over combining the results of several shorthand methods such
+        as :func:`GroupBy.sum` and :func:`GroupBy.mean`.
+
+        >>> df.group_by("a", maintain_order=True).agg(
+        ...     pl.all().sum().suffix("_sum"),
+        ...     pl.all().mean().suffix("_mean"),
+        ... )
+        shape: (3, 5)
+        ┌─────┬───────┬───────┬────────┬────────┐
+        │ a   ┆ b_sum ┆ c_sum ┆ b_mean ┆ c_mean │
+        │ --- ┆ ---   ┆ ---   ┆ ---    ┆ ---    │
+        │ str ┆ i64   ┆ i64   ┆ f64    ┆ f64    │
+        ╞═════╪═══════╪═══════╪════════╪════════╡
+        │ a   ┆ 2     ┆ 8     ┆ 1.0    ┆ 4.0    │
+        │ b   ┆ 5     ┆ 6     ┆ 2.5    ┆ 3.0    │
+        │ c   ┆ 3     ┆ 1     ┆ 3.0    ┆ 1.0    │
+        └─────┴───────┴───────┴────────┴────────┘
+
         """
-        return (
-            self.df.lazy()
-            .group_by(self.by, *self.more_by, maintain_order=self.maintain_order)
-            .agg(*aggs, **named_aggs)
-            .collect(no_optimization=True)
+        pyexprs = parse_as_list_of_aggregations(*aggs, **named_aggs)
+        return self.df.__class__._from_pydf(
+            self.df._df.group_by_agg(self._by_exprs, pyexprs, self.maintain_order)
         )
 
     def map_groups(self, function: Callable[[DataFrame], DataFrame]) -> DataFrame:
@@ -370,11 +520,8 @@ class GroupBy:
         └─────────┴─────┘
 
         """
-        return (
-            self.df.lazy()
-            .group_by(self.by, *self.more_by, maintain_order=self.maintain_order)
-            .head(n)
-            .collect(no_optimization=True)
+        return self.df.__class__._from_pydf(
+            self.df._df.group_by_head(self._by_exprs, n, self.maintain_order)
         )
 
     def tail(self, n: int = 5) -> DataFrame:
@@ -423,11 +570,8 @@ class GroupBy:
         └─────────┴─────┘
 
         """
-        return (
-            self.df.lazy()
-            .group_by(self.by, *self.more_by, maintain_order=self.maintain_order)
-            .tail(n)
-            .collect(no_optimization=True)
+        return self.df.__class__._from_pydf(
+            self.df._df.group_by_tail(self._by_exprs, n, self.maintain_order)
         )
 
     def all(self) -> DataFrame:
@@ -449,7 +593,7 @@ class GroupBy:
         └─────┴───────────┘
 
         """
-        return self.agg(F.all())
+        return self.agg(_shorthand_aggs()["all"])
 
     def count(self) -> DataFrame:
         """
@@ -481,7 +625,9 @@ class GroupBy:
         └────────┴───────┘
 
         """
-        return self.agg(F.count())
+        return self.df.__class__._from_pydf(
+            self.df._df.group_by_count(self._by_exprs, self.maintain_order)
+        )
 
     def first(self) -> DataFrame:
         """
@@ -510,7 +656,7 @@ class GroupBy:
         └────────┴─────┴──────┴───────┘
 
         """
-        return self.agg(F.all().first())
+        return self.agg(_shorthand_aggs()["first"])
 
     def last(self) -> DataFrame:
         """
@@ -539,7 +685,7 @@ class GroupBy:
         └────────┴─────┴──────┴───────┘
 
         """
-        return self.agg(F.all().last())
+        return self.agg(_shorthand_aggs()["last"])
 
     def max(self) -> DataFrame:
         """
@@ -568,7 +714,7 @@ class GroupBy:
         └────────┴─────┴──────┴──────┘
 
         """
-        return self.agg(F.all().max())
+        return self.agg(_shorthand_aggs()["max"])
 
     def mean(self) -> DataFrame:
         """
@@ -597,7 +743,7 @@ class GroupBy:
         └────────┴─────┴──────────┴──────────┘
 
         """
-        return self.agg(F.all().mean())
+        return self.agg(_shorthand_aggs()["mean"])
 
     def median(self) -> DataFrame:
         """
@@ -624,7 +770,7 @@ class GroupBy:
         └────────┴─────┴──────┘
 
         """
-        return self.agg(F.all().median())
+        return self.agg(_shorthand_aggs()["median"])
 
     def min(self) -> DataFrame:
         """
@@ -653,7 +799,7 @@ class GroupBy:
         └────────┴─────┴──────┴───────┘
 
         """
-        return self.agg(F.all().min())
+        return self.agg(_shorthand_aggs()["min"])
 
     def n_unique(self) -> DataFrame:
         """
@@ -680,7 +826,7 @@ class GroupBy:
         └────────┴─────┴─────┘
 
         """
-        return self.agg(F.all().n_unique())
+        return self.agg(_shorthand_aggs()["n_unique"])
 
     def quantile(
         self, quantile: float, interpolation: RollingInterpolationMethod = "nearest"
@@ -746,7 +892,7 @@ class GroupBy:
         └────────┴─────┴──────┴─────┘
 
         """
-        return self.agg(F.all().sum())
+        return self.agg(_shorthand_aggs()["sum"])
 
     @deprecate_renamed_function("map_groups", version="0.19.0")
     def apply(self, function: Callable[[DataFrame], DataFrame]) -> DataFrame:
@@ -795,11 +941,9 @@ class RollingGroupBy:
         self.by = by
         self.check_sorted = check_sorted
 
-    def __iter__(self) -> Self:
-        temp_col = "__POLARS_GB_GROUP_INDICES"
+    def __iter__(self) -> Iterator[tuple[object, DataFrame]]:
         groups_df = (
             self.df.lazy()
-            .with_row_count(name=temp_col)
             .group_by_rolling(
                 index_column=self.time_column,
                 period=self.period,
@@ -808,36 +952,21 @@ class RollingGroupBy:
                 by=self.by,
                 check_sorted=self.check_sorted,
             )
-            .agg(F.col(temp_col))
+            .agg(F.first().agg_groups().alias(_GROUP_INDICES))
             .collect(no_optimization=True)
         )
-
-        group_names = groups_df.select(F.all().exclude(temp_col))
-
-        # When grouping by a single column, group name is a single value
-        # When grouping by multiple columns, group name is a tuple of values
-        self._group_names: Iterator[object] | Iterator[tuple[object, ...]]
-        if self.by is None:
-            self._group_names = iter(group_names.to_series())
-        else:
-            self._group_names = group_names.iter_rows()
-
-        self._group_indices = groups_df.select(temp_col).to_series()
-        self._current_index = 0
-
-        return self
-
-    def __next__(
-        self,
-    ) -> tuple[object, DataFrame] | tuple[tuple[object, ...], DataFrame]:
-        if self._current_index >= len(self._group_indices):
-            raise StopIteration
-
-        group_name = next(self._group_names)
-        group_data = self.df[self._group_indices[self._current_index]]
-        self._current_index += 1
-
-        return group_name, group_data
+        # The frame is our own, so take the indices out of it rather than
+        # selecting the group names into a new frame
+        group_indices = groups_df.drop_in_place(_GROUP_INDICES)
+        return _iter_groups(
+            self.df,
+            groups_df,
+            group_indices,
+            single_key=self.by is None,
+            # Without `by` every window is a slice of the frame; with `by` the
+            # windows of a key may span rows interleaved with other keys
+            contiguous=True if self.by is None else None,
+        )
 
     def agg(
         self,
@@ -981,11 +1110,9 @@ class DynamicGroupBy:
         self.start_by = start_by
         self.check_sorted = check_sorted
 
-    def __iter__(self) -> Self:
-        temp_col = "__POLARS_GB_GROUP_INDICES"
+    def __iter__(self) -> Iterator[tuple[object, DataFrame]]:
         groups_df = (
             self.df.lazy()
-            .with_row_count(name=temp_col)
             .group_by_dynamic(
                 index_column=self.time_column,
                 every=self.every,
@@ -999,36 +1126,21 @@ class DynamicGroupBy:
                 start_by=self.start_by,
                 check_sorted=self.check_sorted,
             )
-            .agg(F.col(temp_col))
+            .agg(F.first().agg_groups().alias(_GROUP_INDICES))
             .collect(no_optimization=True)
         )
-
-        group_names = groups_df.select(F.all().exclude(temp_col))
-
-        # When grouping by a single column, group name is a single value
-        # When grouping by multiple columns, group name is a tuple of values
-        self._group_names: Iterator[object] | Iterator[tuple[object, ...]]
-        if self.by is None:
-            self._group_names = iter(group_names.to_series())
-        else:
-            self._group_names = group_names.iter_rows()
-
-        self._group_indices = groups_df.select(temp_col).to_series()
-        self._current_index = 0
-
-        return self
-
-    def __next__(
-        self,
-    ) -> tuple[object, DataFrame] | tuple[tuple[object, ...], DataFrame]:
-        if self._current_index >= len(self._group_indices):
-            raise StopIteration
-
-        group_name = next(self._group_names)
-        group_data = self.df[self._group_indices[self._current_index]]
-        self._current_index += 1
-
-        return group_name, group_data
+        # The frame is our own, so take the indices out of it rather than
+        # selecting the group names into a new frame
+        group_indices = groups_df.drop_in_place(_GROUP_INDICES)
+        return _iter_groups(
+            self.df,
+            groups_df,
+            group_indices,
+            single_key=self.by is None,
+            # Without `by` every window is a slice of the frame; with `by` the
+            # windows of a key may span rows interleaved with other keys
+            contiguous=True if self.by is None else None,
+        )
 
     def agg(
         self,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, Iterable
 
 from polars import functions as F
-from polars.utils._parse_expr_input import parse_as_list_of_expressions
+from polars.utils._parse_expr_input import parse_as_list_of_aggregations
 from polars.utils._wrap import wrap_ldf
 from polars.utils.deprecation import deprecate_renamed_function
 
@@ -135,14 +135,7 @@ class LazyGroupBy:
         └─────┴───────┴────────────────┘
 
         """
-        if aggs and isinstance(aggs[0], dict):
-            raise TypeError(
-                "specifying aggregations as a dictionary is not supported"
-                "\n\nTry unpacking the dictionary to take advantage of the keyword syntax"
-                " of the `agg` method."
-            )
-
-        pyexprs = parse_as_list_of_expressions(*aggs, **named_aggs)
+        pyexprs = parse_as_list_of_aggregations(*aggs, **named_aggs)
         return wrap_ldf(self.lgb.agg(pyexprs))
 
     def map_groups(
@@ -40,6 +40,31 @@ def parse_as_list_of_expressions(
     return exprs
 
 
+def parse_as_list_of_aggregations(
+    *aggs: IntoExpr | Iterable[IntoExpr],
+    **named_aggs: IntoExpr,
+) -> list[PyExpr]:
+    """
+    Parse the inputs of a group by ``agg`` call into a list of expressions.
+
+    Parameters
+    ----------
+    *aggs
+        Aggregations to be parsed as expressions, specified as positional arguments.
+    **named_aggs
+        Additional aggregations to be parsed as expressions, specified as keyword
+        arguments. The expressions will be renamed to the keyword used.
+
+    """
+    if aggs and isinstance(aggs[0], dict):
+        raise TypeError(
+            "specifying aggregations as a dictionary is not supported"
+            "\n\nTry unpacking the dictionary to take advantage of the keyword syntax"
+            " of the `agg` method."
+        )
+    return parse_as_list_of_expressions(*aggs, **named_aggs)
+
+
 def _parse_regular_inputs(
     inputs: tuple[IntoExpr | Iterable[IntoExpr], ...],
     *,
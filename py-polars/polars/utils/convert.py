@@ -67,6 +67,7 @@ def _timedelta_to_pl_duration(td: timedelta | str) -> str:
     ...
 
 
+@lru_cache(256)
 def _timedelta_to_pl_duration(td: timedelta | str | None) -> str | None:
     """Convert python timedelta to a polars duration string."""
     if td is None or isinstance(td, str):
@@ -26,6 +26,7 @@ use pyo3::types::{PyBytes, PyDict, PyList, PyTuple};
 use crate::conversion::parse_parquet_compression;
 use crate::conversion::{ObjectValue, Wrap};
 use crate::error::PyPolarsErr;
+use crate::expr::ToExprs;
 use crate::file::{get_either_file, get_file_like, get_mmap_bytes_reader, EitherRustPythonFile};
 use crate::map::dataframe::{
     apply_lambda_unknown, apply_lambda_with_bool_out_type, apply_lambda_with_primitive_out_type,
@@ -89,6 +90,41 @@ impl PyDataFrame {
         Ok(df.into())
     }
 
+    fn lazy_group_by(&self, by: Vec<PyExpr>, maintain_order: bool) -> LazyGroupBy {
+        let ldf = self.df.clone().lazy();
+        let by = by.to_exprs();
+        if maintain_order {
+            ldf.group_by_stable(by)
+        } else {
+            ldf.group_by(by)
+        }
+    }
+
+    /// Evaluate the `by` expressions of a group by into key columns.
+    fn group_by_keys(&self, py: Python, by: Vec<PyExpr>) -> PyResult<Vec<Series>> {
+        let by = self.df.clone().lazy().select(by.to_exprs());
+        Ok(Self::collect_eager(py, by)?.df.get_columns().to_vec())
+    }
+
+    /// Collect a query that consists of a single eager operation.
+    /// None of the pushdowns apply to such a query, so we don't run them.
+    fn collect_eager(py: Python, ldf: LazyFrame) -> PyResult<Self> {
+        #[allow(unused_mut)]
+        let mut ldf = ldf
+            .with_predicate_pushdown(false)
+            .with_projection_pushdown(false)
+            .with_slice_pushdown(false);
+        #[cfg(feature = "cse")]
+        {
+            ldf = ldf.with_comm_subplan_elim(false);
+            ldf = ldf.with_comm_subexpr_elim(false);
+        }
+        // if we don't allow threads and we have udfs trying to acquire the gil from different
+        // threads we deadlock.
+        let df = py.allow_threads(|| ldf.collect().map_err(PyPolarsErr::from))?;
+        Ok(df.into())
+    }
+
     #[cfg(feature = "ipc_streaming")]
     fn __getstate__(&self, py: Python) -> PyResult<PyObject> {
         // Used in pickle/pickling
@@ -1124,8 +1160,81 @@ impl PyDataFrame {
         Ok(df.into())
     }
 
+    pub fn group_by_agg(
+        &self,
+        py: Python,
+        by: Vec<PyExpr>,
+        aggs: Vec<PyExpr>,
+        maintain_order: bool,
+    ) -> PyResult<Self> {
+        let ldf = self.lazy_group_by(by, maintain_order).agg(aggs.to_exprs());
+        Self::collect_eager(py, ldf)
+    }
+
+    pub fn group_by_head(
+        &self,
+        py: Python,
+        by: Vec<PyExpr>,
+        n: usize,
+        maintain_order: bool,
+    ) -> PyResult<Self> {
+        let ldf = self.lazy_group_by(by, maintain_order).head(Some(n));
+        Self::collect_eager(py, ldf)
+    }
+
+    pub fn group_by_tail(
+        &self,
+        py: Python,
+        by: Vec<PyExpr>,
+        n: usize,
+        maintain_order: bool,
+    ) -> PyResult<Self> {
+        let ldf = self.lazy_group_by(by, maintain_order).tail(Some(n));
+        Self::collect_eager(py, ldf)
+    }
+
+    pub fn group_by_indices(
+        &self,
+        py: Python,
+        by: Vec<PyExpr>,
+        maintain_order: bool,
+    ) -> PyResult<(Self, PySeries)> {
+        let by = self.group_by_keys(py, by)?;
+        let (keys, indices) = py
+            .allow_threads(|| {
+                let gb = self.df.group_by_with_series(by, true, maintain_order)?;
+                // Take the row indices straight from the groups, rather than aggregating
+                // a row count column.
+                let indices = gb.get_groups().as_list_chunked().into_series();
+                PolarsResult::Ok((DataFrame::new_no_checks(gb.keys()), indices))
+            })
+            .map_err(PyPolarsErr::from)?;
+        Ok((keys.into(), indices.into()))
+    }
+
+    pub fn group_by_count(
+        &self,
+        py: Python,
+        by: Vec<PyExpr>,
+        maintain_order: bool,
+    ) -> PyResult<Self> {
+        let by = self.group_by_keys(py, by)?;
+        let df = py
+            .allow_threads(|| {
+                let gb = self.df.group_by_with_series(by, true, maintain_order)?;
+                // The group sizes are known from the groups, no need to aggregate any
+                // column.
+                let mut columns = gb.keys();
+                columns.push(gb.get_groups().group_lengths("count").into_series());
+                DataFrame::new(columns)
+            })
+            .map_err(PyPolarsErr::from)?;
+        Ok(df.into())
+    }
+
     pub fn group_by_map_groups(
         &self,
+        py: Python,
         by: Vec<&str>,
         lambda: PyObject,
         maintain_order: bool,
@@ -1137,12 +1246,12 @@ impl PyDataFrame {
         }
         .map_err(PyPolarsErr::from)?;
 
+        // Look up the wrapper once, instead of importing polars for every group.
+        let wrap_df = py_modules::POLARS.getattr(py, "wrap_df")?;
         let function = move |df: DataFrame| {
             Python::with_gil(|py| {
-                let pypolars = PyModule::import(py, "polars").unwrap();
                 let pydf = PyDataFrame::new(df);
-                let python_df_wrapper =
-                    pypolars.getattr("wrap_df").unwrap().call1((pydf,)).unwrap();
+                let python_df_wrapper = wrap_df.call1(py, (pydf,)).unwrap();
 
                 // Call the lambda and get a python-side DataFrame wrapper.
                 let result_df_wrapper = match lambda.call1(py, (python_df_wrapper,)) {
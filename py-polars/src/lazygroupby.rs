@@ -7,6 +7,7 @@ use pyo3::prelude::*;
 use crate::conversion::Wrap;
 use crate::error::PyPolarsErr;
 use crate::expr::ToExprs;
+use crate::py_modules::POLARS;
 use crate::{PyDataFrame, PyExpr, PyLazyFrame};
 
 #[pyclass]
@@ -36,6 +37,7 @@ impl PyLazyGroupBy {
 
     fn map_groups(
         &mut self,
+        py: Python,
         lambda: PyObject,
         schema: Option<Wrap<Schema>>,
     ) -> PyResult<PyLazyFrame> {
@@ -47,17 +49,15 @@ impl PyLazyGroupBy {
                 .map_err(PyPolarsErr::from)?,
         };
 
+        // resolve the wrapper once instead of importing polars for every group
+        let wrap_df = POLARS.getattr(py, "wrap_df")?;
         let function = move |df: DataFrame| {
             Python::with_gil(|py| {
-                // get the pypolars module
-                let pypolars = PyModule::import(py, "polars").unwrap();
-
                 // create a PyDataFrame struct/object for Python
                 let pydf = PyDataFrame::new(df);
 
-                // Wrap this PySeries object in the python side DataFrame wrapper
-                let python_df_wrapper =
-                    pypolars.getattr("wrap_df").unwrap().call1((pydf,)).unwrap();
+                // Wrap this PyDataFrame object in the python side DataFrame wrapper
+                let python_df_wrapper = wrap_df.call1(py, (pydf,)).unwrap();
 
                 // call the lambda and get a python side DataFrame wrapper
                 let result_df_wrapper = lambda.call1(py, (python_df_wrapper,)).map_err(|e| {
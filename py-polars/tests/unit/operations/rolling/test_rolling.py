@@ -790,6 +790,36 @@ def test_group_by_rolling_iter() -> None:
     ]
     assert result2 == expected2
 
+    # Windows without any rows should give empty groups
+    result3 = [
+        (name, data.shape)
+        for name, data in df.group_by_rolling(
+            index_column="date", period="2d", closed="left"
+        )
+    ]
+    expected3 = [
+        (date(2020, 1, 1), (0, 3)),
+        (date(2020, 1, 2), (1, 3)),
+        (date(2020, 1, 5), (0, 3)),
+    ]
+    assert result3 == expected3
+
+    # Windows of a 'by' key over rows interleaved with other keys
+    df = pl.DataFrame(
+        {"index": [1, 2, 3, 4], "a": [1, 2, 1, 2], "b": [4, 5, 6, 7]}
+    ).set_sorted("index")
+    result4 = [
+        (name, data["b"].to_list())
+        for name, data in df.group_by_rolling(index_column="index", period="3i", by="a")
+    ]
+    expected4 = [
+        ((1, 1), [4]),
+        ((1, 3), [4, 6]),
+        ((2, 2), [5]),
+        ((2, 4), [5, 7]),
+    ]
+    assert result4 == expected4
+
 
 def test_group_by_rolling_negative_period() -> None:
     df = pl.DataFrame({"ts": [datetime(2020, 1, 1)], "value": [1]}).with_columns(
@@ -102,6 +102,16 @@ def test_group_by_shorthand_quantile(df: pl.DataFrame) -> None:
     assert result.rows() == expected
 
 
+def test_group_by_count_key_named_count() -> None:
+    df = pl.DataFrame({"count": [1, 1, 2]})
+    with pytest.raises(pl.DuplicateError):
+        df.group_by("count").count()
+
+    result = df.group_by(pl.col("count").alias("key"), maintain_order=True).count()
+    assert result.rows() == [(1, 2), (2, 1)]
+    assert result.columns == ["key", "count"]
+
+
 def test_group_by_args() -> None:
     df = pl.DataFrame(
         {
@@ -169,6 +179,28 @@ def test_group_by_iteration() -> None:
     assert result3 == expected3
 
 
+def test_group_by_iteration_contiguous_groups() -> None:
+    df = pl.DataFrame({"foo": [1, 1, 2, 3, 3, 3], "bar": [1, 2, 3, 4, 5, 6]})
+    result = [
+        (group, data.rows()) for group, data in df.group_by("foo", maintain_order=True)
+    ]
+    expected = [
+        (1, [(1, 1), (1, 2)]),
+        (2, [(2, 3)]),
+        (3, [(3, 4), (3, 5), (3, 6)]),
+    ]
+    assert result == expected
+
+
+def test_group_by_iteration_list_key() -> None:
+    df = pl.DataFrame({"foo": [[1], [2], [1]], "bar": [1, 2, 3]})
+    result = []
+    for name, data in df.group_by("foo", maintain_order=True):
+        assert isinstance(name, pl.Series)
+        result.append((name.to_list(), data["bar"].to_list()))
+    assert result == [([1], [1, 3]), ([2], [2])]
+
+
 def bad_agg_parameters() -> list[Any]:
     """Currently, IntoExpr and Iterable[IntoExpr] are supported."""
     return [str, "b".join]
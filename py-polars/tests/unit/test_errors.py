@@ -612,6 +612,10 @@ def test_invalid_group_by_arg() -> None:
         TypeError, match="specifying aggregations as a dictionary is not supported"
     ):
         df.group_by(1).agg({"a": "sum"})
+    with pytest.raises(
+        TypeError, match="specifying aggregations as a dictionary is not supported"
+    ):
+        df.lazy().group_by(1).agg({"a": "sum"})
 
 
 def test_no_sorted_err() -> None: